@@ -1,7 +1,7 @@
 """
 Predictive Readiness Forecasting Models for TLDM BITS
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional, Any, Union
 from datetime import datetime
 import uuid
@@ -31,6 +31,8 @@ class RiskLevel(str, Enum):
 
 # Input Models
 class UsageData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     date: str
     category: str
     quantity_used: int
@@ -54,6 +56,8 @@ class ExerciseEvent(BaseModel):
 
 
 class SupplyChainData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     category: str
     average_lead_time: int  # days
     variability: int  # ± days
@@ -69,6 +73,8 @@ class ShortageRecord(BaseModel):
 
 
 class HistoricalData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     period: str
     readiness: float
     consumption: int
@@ -77,6 +83,8 @@ class HistoricalData(BaseModel):
 
 
 class InventorySnapshot(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     inventory_id: str
     ordnance_category: str
     ordnance_name: str
@@ -87,6 +95,8 @@ class InventorySnapshot(BaseModel):
 
 
 class ForecastingConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     time_horizon_days: int = 90
     confidence_level: float = 0.95
     risk_tolerance: str = "conservative"
@@ -105,6 +115,8 @@ class ForecastingInput(BaseModel):
 
 # Output Models
 class ReadinessProjection(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     days: int
     readiness: float
     confidence_interval: List[float]  # [lower, upper]
@@ -158,7 +170,7 @@ class TimeframeProjections(BaseModel):
 
 
 class ForecastResult(BaseModel):
-    forecast_id: str = Field(default_factory=lambda: f"fcst_{datetime.now().strftime('%Y_%m_%d')}_{str(uuid.uuid4())[:8]}")
+    forecast_id: str = Field(default_factory=lambda: f"fcst_{datetime.now().strftime('%Y_%m_%d')}_{uuid.uuid4().hex[:8]}")
     generated_at: datetime = Field(default_factory=datetime.utcnow)
     timeframe: TimeframeProjections
     critical_alerts: List[CriticalAlert]
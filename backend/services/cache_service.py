@@ -0,0 +1,65 @@
+"""
+Response Cache Service for Forecasting API
+Redis-backed cache for serialized payloads; disabled when REDIS_URL is not set
+"""
+import os
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Cache of already-serialized JSON payloads keyed by string"""
+
+    def __init__(self):
+        self.redis_url = os.environ.get('REDIS_URL')
+        self._client: Optional[redis.Redis] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.redis_url)
+
+    def _get_client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.from_url(self.redis_url)
+        return self._client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached payload, treating any cache failure as a miss"""
+        if not self.enabled:
+            return None
+
+        try:
+            return await self._get_client().get(key)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, payload: bytes, ttl_seconds: int):
+        """Store a payload with an expiry"""
+        if not self.enabled:
+            return
+
+        try:
+            await self._get_client().set(key, payload, ex=ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+    async def delete(self, *keys: str):
+        """Invalidate cached payloads"""
+        if not self.enabled or not keys:
+            return
+
+        try:
+            await self._get_client().delete(*keys)
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for {keys}: {e}")
+
+    async def close(self):
+        """Close the Redis connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -2,18 +2,25 @@
 Enhanced Export Service for Forecasting Reports
 Supports PDF and Excel export with professional formatting
 """
-import json
 import os
 import logging
-from typing import Dict, Any, List
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, AsyncIterator, BinaryIO, Callable, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
 from io import BytesIO
-import pandas as pd
+from itertools import chain
+from string import Template
+from tempfile import SpooledTemporaryFile
+from xlsxwriter.format import Format
+from xlsxwriter.workbook import Workbook
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, Image, Flowable
 from reportlab.platypus.flowables import PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
@@ -21,41 +28,164 @@ from models.forecasting import ForecastResult
 
 logger = logging.getLogger(__name__)
 
+# Skip per-attribute validation of ReportLab shapes; report content is built by this module only
+rl_config.shapeChecking = 0
+
+# Report palette, parsed once
+_GRAY_50 = colors.HexColor('#f9fafb')
+_GRAY_100 = colors.HexColor('#f3f4f6')
+_GRAY_200 = colors.HexColor('#e5e7eb')
+_GRAY_300 = colors.HexColor('#d1d5db')
+_GRAY_700 = colors.HexColor('#374151')
+_GRAY_900 = colors.HexColor('#1f2937')
+_RED_50 = colors.HexColor('#fef2f2')
+_RED_300 = colors.HexColor('#fca5a5')
+_RED_600 = colors.HexColor('#dc2626')
+_GREEN_50 = colors.HexColor('#f0fdf4')
+_GREEN_300 = colors.HexColor('#86efac')
+_GREEN_600 = colors.HexColor('#059669')
+
+# Table styles shared by every PDF report
+_METADATA_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), _GRAY_50),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, _GRAY_200)
+])
+
+_PROJECTIONS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _GRAY_900),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BACKGROUND', (0, 1), (-1, -1), _GRAY_50),
+    ('GRID', (0, 0), (-1, -1), 1, _GRAY_200)
+])
+
+_ALERTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _RED_600),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), _RED_50),
+    ('GRID', (0, 0), (-1, -1), 1, _RED_300)
+])
+
+_PROCUREMENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _GREEN_600),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), _GREEN_50),
+    ('GRID', (0, 0), (-1, -1), 1, _GREEN_300)
+])
+
+_CONFIDENCE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), _GRAY_100),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, _GRAY_300)
+])
+
+# Excel sheet column headers
+_SUMMARY_SHEET_HEADER = ('Metric', 'Value')
+_PROJECTIONS_SHEET_HEADER = (
+    'Timeframe', 'Days', 'Readiness (%)', 'Lower Bound (%)', 'Upper Bound (%)', 'Risk Level'
+)
+_ALERTS_SHEET_HEADER = (
+    'Category', 'Expected Shortage Date', 'Severity', 'Current Stock Level', 'Projected Need', 'Impacted Operations'
+)
+_PROCUREMENT_SHEET_HEADER = (
+    'Priority', 'Category', 'Recommended Quantity', 'Deadline', 'Supplier Lead Time (Days)', 'Rationale'
+)
+_MITIGATION_SHEET_HEADER = (
+    'Strategy', 'Effectiveness (%)', 'Implementation Time (Days)', 'Impact', 'Items Affected'
+)
+
+# Executive summary wording, with whitespace already collapsed as Paragraph would render it
+_PROJECTIONS_SUMMARY_TEMPLATE = Template(
+    "Current readiness stands at $current. Over the next $days days, "
+    "projections indicate readiness levels will $trend, reaching $final% "
+    "with a $risk risk assessment. "
+    "The forecast shows $alerts critical alert(s) and "
+    "$recommendations procurement recommendation(s) requiring immediate attention. "
+    "Model confidence is $confidence with $reliability reliability."
+)
+_NO_PROJECTIONS_SUMMARY_TEMPLATE = Template(
+    "Current readiness stands at $current. Insufficient projection data available "
+    "for detailed forecasting. $alerts critical alert(s) identified."
+)
+
+# Rendered reports kept in memory for repeat downloads, and the largest report worth keeping
+RENDERED_REPORT_CACHE_SIZE = 32
+RENDERED_REPORT_CACHE_MAX_BYTES = 1024 * 1024
+
+# Streamed exports are written to a spooled file that only touches disk for very large reports
+EXPORT_CHUNK_SIZE = 64 * 1024
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
 
 class ForecastExportService:
     """Service for exporting forecast reports in various formats"""
     
+    # Report stylesheet, built on first use and shared by every instance
+    _shared_styles: Optional[StyleSheet1] = None
+    
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = self._get_styles()
+        # Recently rendered reports; byte exports render in worker threads, hence the lock
+        self._rendered_reports: OrderedDict[Tuple[str, str, str], bytes] = OrderedDict()
+        self._rendered_reports_lock = threading.Lock()
     
-    def _setup_custom_styles(self):
+    @classmethod
+    def _get_styles(cls) -> StyleSheet1:
+        """Get the shared report stylesheet, building it once"""
+        if cls._shared_styles is None:
+            styles = getSampleStyleSheet()
+            cls._setup_custom_styles(styles)
+            cls._shared_styles = styles
+        return cls._shared_styles
+    
+    @staticmethod
+    def _setup_custom_styles(styles: StyleSheet1):
         """Setup custom report styles"""
         # TLDM Header Style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='TLDMHeader',
-            parent=self.styles['Title'],
+            parent=styles['Title'],
             fontSize=18,
             spaceAfter=30,
-            textColor=colors.HexColor('#1f2937'),
+            textColor=_GRAY_900,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
         ))
         
         # Section Header Style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeader',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=14,
             spaceAfter=12,
-            textColor=colors.HexColor('#374151'),
+            textColor=_GRAY_700,
             fontName='Helvetica-Bold'
         ))
         
         # Military Classification Style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='Classification',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             textColor=colors.red,
             alignment=TA_CENTER,
@@ -64,293 +194,351 @@ class ForecastExportService:
 
     async def export_forecast_pdf(self, forecast: ForecastResult) -> bytes:
         """Export forecast as PDF report"""
-        try:
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(
-                buffer,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
-            )
-            
-            # Build PDF content
-            story = []
-            
-            # Classification header
-            story.append(Paragraph("OFFICIAL USE ONLY", self.styles['Classification']))
-            story.append(Spacer(1, 12))
-            
-            # Report header
-            story.append(Paragraph(
-                "TENTERA LAUT DIRAJA MALAYSIA<br/>READINESS FORECAST REPORT",
-                self.styles['TLDMHeader']
-            ))
-            story.append(Spacer(1, 20))
-            
-            # Report metadata
-            metadata_data = [
-                ['Forecast ID:', forecast.forecast_id],
-                ['Generated:', forecast.generated_at.strftime('%Y-%m-%d %H:%M:%S UTC')],
-                ['Current Readiness:', f"{forecast.timeframe.current_readiness:.1f}%"],
-                ['Confidence:', f"{forecast.confidence_metrics.model_accuracy * 100:.0f}%"],
-                ['Classification:', 'OFFICIAL USE ONLY']
-            ]
-            
-            metadata_table = Table(metadata_data, colWidths=[2*inch, 3*inch])
-            metadata_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f9fafb')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb'))
-            ]))
-            story.append(metadata_table)
-            story.append(Spacer(1, 20))
-            
-            # Executive Summary
-            story.append(Paragraph("EXECUTIVE SUMMARY", self.styles['SectionHeader']))
-            
-            # Readiness projections summary
-            projections_summary = self._generate_projections_summary(forecast)
-            story.append(Paragraph(projections_summary, self.styles['Normal']))
-            story.append(Spacer(1, 15))
-            
-            # Readiness Projections Table
-            story.append(Paragraph("READINESS PROJECTIONS", self.styles['SectionHeader']))
-            
-            projection_data = [['Timeframe', 'Projected Readiness', 'Confidence Interval', 'Risk Level']]
-            projection_data.append(['Current', f"{forecast.timeframe.current_readiness:.1f}%", 'N/A', 'Baseline'])
-            
-            for proj in forecast.timeframe.projections:
-                confidence_range = f"{proj.confidence_interval[0]:.1f}% - {proj.confidence_interval[1]:.1f}%"
-                projection_data.append([
+        return await asyncio.to_thread(self._render_report, self._write_forecast_pdf, forecast)
+
+    async def stream_forecast_pdf(self, forecast: ForecastResult) -> AsyncIterator[bytes]:
+        """Export forecast as PDF report, yielding it in chunks"""
+        async for chunk in self._stream_report(self._write_forecast_pdf, forecast):
+            yield chunk
+
+    def _write_forecast_pdf(self, forecast: ForecastResult, output: BinaryIO):
+        """Write the PDF report for a forecast to a binary file object"""
+        doc = SimpleDocTemplate(
+            output,
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18
+        )
+        
+        # Build PDF content section by section
+        figures = self._format_report_figures(forecast)
+        story = chain(
+            self._emit_header(forecast, figures),
+            self._emit_executive_summary(forecast, figures),
+            self._emit_projections(forecast, figures),
+            self._emit_critical_alerts(forecast),
+            self._emit_procurement(forecast),
+            self._emit_reliability(forecast, figures)
+        )
+        
+        # Build PDF
+        doc.build(list(story))
+
+    @staticmethod
+    def _format_report_figures(forecast: ForecastResult) -> Dict[str, str]:
+        """Format the headline figures once for every place a report shows them"""
+        confidence_metrics = forecast.confidence_metrics
+        return {
+            'generated_at': forecast.generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'current_readiness': f"{forecast.timeframe.current_readiness:.1f}%",
+            'confidence': f"{confidence_metrics.model_accuracy * 100:.0f}%",
+            'model_accuracy': f"{confidence_metrics.model_accuracy * 100:.1f}%",
+            'data_quality_score': f"{confidence_metrics.data_quality_score * 100:.1f}%"
+        }
+
+    def _emit_header(self, forecast: ForecastResult, figures: Dict[str, str]) -> Iterator[Flowable]:
+        """Classification banner, report title and report metadata"""
+        # Classification header
+        yield Paragraph("OFFICIAL USE ONLY", self.styles['Classification'])
+        yield Spacer(1, 12)
+        
+        # Report header
+        yield Paragraph(
+            "TENTERA LAUT DIRAJA MALAYSIA<br/>READINESS FORECAST REPORT",
+            self.styles['TLDMHeader']
+        )
+        yield Spacer(1, 20)
+        
+        # Report metadata
+        metadata_data = [
+            ['Forecast ID:', forecast.forecast_id],
+            ['Generated:', f"{figures['generated_at']} UTC"],
+            ['Current Readiness:', figures['current_readiness']],
+            ['Confidence:', figures['confidence']],
+            ['Classification:', 'OFFICIAL USE ONLY']
+        ]
+        
+        metadata_table = Table(metadata_data, colWidths=[2*inch, 3*inch])
+        metadata_table.setStyle(_METADATA_TABLE_STYLE)
+        yield metadata_table
+        yield Spacer(1, 20)
+
+    def _emit_executive_summary(self, forecast: ForecastResult, figures: Dict[str, str]) -> Iterator[Flowable]:
+        """Executive summary of the readiness projections"""
+        yield Paragraph("EXECUTIVE SUMMARY", self.styles['SectionHeader'])
+        
+        # Readiness projections summary
+        projections_summary = self._generate_projections_summary(forecast, figures)
+        yield Paragraph(projections_summary, self.styles['Normal'])
+        yield Spacer(1, 15)
+
+    def _emit_projections(self, forecast: ForecastResult, figures: Dict[str, str]) -> Iterator[Flowable]:
+        """Readiness projections table"""
+        yield Paragraph("READINESS PROJECTIONS", self.styles['SectionHeader'])
+        
+        projection_data = [
+            ['Timeframe', 'Projected Readiness', 'Confidence Interval', 'Risk Level'],
+            ['Current', figures['current_readiness'], 'N/A', 'Baseline'],
+            *[
+                [
                     f"{proj.days} days",
                     f"{proj.readiness:.1f}%",
-                    confidence_range,
+                    f"{proj.confidence_interval[0]:.1f}% - {proj.confidence_interval[1]:.1f}%",
                     proj.risk_level.upper()
-                ])
-            
-            projections_table = Table(projection_data, colWidths=[1.2*inch, 1.3*inch, 1.8*inch, 1.2*inch])
-            projections_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f2937')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f9fafb')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb'))
-            ]))
-            story.append(projections_table)
-            story.append(Spacer(1, 20))
-            
-            # Critical Alerts
-            if forecast.critical_alerts:
-                story.append(Paragraph("CRITICAL ALERTS", self.styles['SectionHeader']))
-                
-                alert_data = [['Category', 'Expected Shortage', 'Severity', 'Current Stock', 'Projected Need']]
-                for alert in forecast.critical_alerts:
-                    alert_data.append([
-                        alert.category,
-                        alert.expected_shortage_date,
-                        alert.severity.upper(),
-                        str(alert.current_stock_level),
-                        str(alert.projected_need)
-                    ])
-                
-                alerts_table = Table(alert_data, colWidths=[1.2*inch, 1.2*inch, 0.8*inch, 0.9*inch, 1.0*inch])
-                alerts_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef2f2')),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fca5a5'))
-                ]))
-                story.append(alerts_table)
-                story.append(Spacer(1, 20))
-            
-            # Procurement Recommendations
-            if forecast.procurement_recommendations:
-                story.append(Paragraph("PROCUREMENT RECOMMENDATIONS", self.styles['SectionHeader']))
-                
-                proc_data = [['Priority', 'Category', 'Quantity', 'Deadline', 'Lead Time']]
-                for rec in forecast.procurement_recommendations:
-                    proc_data.append([
-                        rec.priority.upper(),
-                        rec.category,
-                        f"{rec.recommended_quantity:,}",
-                        rec.deadline,
-                        f"{rec.supplier_lead_time} days"
-                    ])
-                
-                proc_table = Table(proc_data, colWidths=[0.8*inch, 1.5*inch, 1.0*inch, 1.0*inch, 0.9*inch])
-                proc_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#059669')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0fdf4')),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#86efac'))
-                ]))
-                story.append(proc_table)
-                story.append(Spacer(1, 20))
-            
-            # Confidence Metrics
-            story.append(Paragraph("FORECAST RELIABILITY", self.styles['SectionHeader']))
-            confidence_data = [
-                ['Model Accuracy', f"{forecast.confidence_metrics.model_accuracy * 100:.1f}%"],
-                ['Data Quality Score', f"{forecast.confidence_metrics.data_quality_score * 100:.1f}%"],
-                ['Forecast Reliability', forecast.confidence_metrics.forecast_reliability.upper()],
-                ['Generation Method', forecast.metadata.get('generated_as', 'Unknown').replace('_', ' ').title()]
+                ]
+                for proj in forecast.timeframe.projections
             ]
-            
-            confidence_table = Table(confidence_data, colWidths=[2.5*inch, 2*inch])
-            confidence_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f3f4f6')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#d1d5db'))
-            ]))
-            story.append(confidence_table)
-            story.append(Spacer(1, 30))
-            
-            # Footer
-            story.append(Paragraph(
-                "This report is generated by the BITS Predictive Forecasting System for operational planning purposes. "
-                "All projections are estimates based on historical data and current trends. "
-                "Actual results may vary due to operational requirements and external factors.",
-                self.styles['Normal']
-            ))
-            
-            # Build PDF
-            doc.build(story)
-            buffer.seek(0)
-            return buffer.read()
-            
-        except Exception as e:
-            logger.error(f"Failed to generate PDF report: {e}")
-            raise
+        ]
+        
+        projections_table = LongTable(projection_data, colWidths=[1.2*inch, 1.3*inch, 1.8*inch, 1.2*inch], repeatRows=1)
+        projections_table.setStyle(_PROJECTIONS_TABLE_STYLE)
+        yield projections_table
+        yield Spacer(1, 20)
+
+    def _emit_critical_alerts(self, forecast: ForecastResult) -> Iterator[Flowable]:
+        """Critical alerts table, when there are any"""
+        if not forecast.critical_alerts:
+            return
+        
+        yield Paragraph("CRITICAL ALERTS", self.styles['SectionHeader'])
+        
+        alert_data = [
+            ['Category', 'Expected Shortage', 'Severity', 'Current Stock', 'Projected Need'],
+            *[
+                [
+                    alert.category,
+                    alert.expected_shortage_date,
+                    alert.severity.upper(),
+                    str(alert.current_stock_level),
+                    str(alert.projected_need)
+                ]
+                for alert in forecast.critical_alerts
+            ]
+        ]
+        
+        alerts_table = LongTable(alert_data, colWidths=[1.2*inch, 1.2*inch, 0.8*inch, 0.9*inch, 1.0*inch], repeatRows=1)
+        alerts_table.setStyle(_ALERTS_TABLE_STYLE)
+        yield alerts_table
+        yield Spacer(1, 20)
+
+    def _emit_procurement(self, forecast: ForecastResult) -> Iterator[Flowable]:
+        """Procurement recommendations table, when there are any"""
+        if not forecast.procurement_recommendations:
+            return
+        
+        yield Paragraph("PROCUREMENT RECOMMENDATIONS", self.styles['SectionHeader'])
+        
+        proc_data = [
+            ['Priority', 'Category', 'Quantity', 'Deadline', 'Lead Time'],
+            *[
+                [
+                    rec.priority.upper(),
+                    rec.category,
+                    f"{rec.recommended_quantity:,}",
+                    rec.deadline,
+                    f"{rec.supplier_lead_time} days"
+                ]
+                for rec in forecast.procurement_recommendations
+            ]
+        ]
+        
+        proc_table = LongTable(proc_data, colWidths=[0.8*inch, 1.5*inch, 1.0*inch, 1.0*inch, 0.9*inch], repeatRows=1)
+        proc_table.setStyle(_PROCUREMENT_TABLE_STYLE)
+        yield proc_table
+        yield Spacer(1, 20)
+
+    def _emit_reliability(self, forecast: ForecastResult, figures: Dict[str, str]) -> Iterator[Flowable]:
+        """Confidence metrics and the report footer"""
+        # Confidence Metrics
+        yield Paragraph("FORECAST RELIABILITY", self.styles['SectionHeader'])
+        confidence_data = [
+            ['Model Accuracy', figures['model_accuracy']],
+            ['Data Quality Score', figures['data_quality_score']],
+            ['Forecast Reliability', forecast.confidence_metrics.forecast_reliability.upper()],
+            ['Generation Method', forecast.metadata.get('generated_as', 'Unknown').replace('_', ' ').title()]
+        ]
+        
+        confidence_table = Table(confidence_data, colWidths=[2.5*inch, 2*inch])
+        confidence_table.setStyle(_CONFIDENCE_TABLE_STYLE)
+        yield confidence_table
+        yield Spacer(1, 30)
+        
+        # Footer
+        yield Paragraph(
+            "This report is generated by the BITS Predictive Forecasting System for operational planning purposes. "
+            "All projections are estimates based on historical data and current trends. "
+            "Actual results may vary due to operational requirements and external factors.",
+            self.styles['Normal']
+        )
 
     async def export_forecast_excel(self, forecast: ForecastResult) -> bytes:
         """Export forecast as Excel workbook"""
-        try:
+        return await asyncio.to_thread(self._render_report, self._write_forecast_excel, forecast)
+
+    async def stream_forecast_excel(self, forecast: ForecastResult) -> AsyncIterator[bytes]:
+        """Export forecast as Excel workbook, yielding it in chunks"""
+        async for chunk in self._stream_report(self._write_forecast_excel, forecast):
+            yield chunk
+
+    def _write_forecast_excel(self, forecast: ForecastResult, output: BinaryIO):
+        """Write the Excel workbook for a forecast to a binary file object"""
+        # Constant memory mode flushes each row to disk instead of keeping every cell in memory
+        workbook = Workbook(output, {'constant_memory': True})
+        header_format = workbook.add_format({'bold': True})
+        
+        # Summary Sheet
+        figures = self._format_report_figures(forecast)
+        self._append_sheet(workbook, header_format, 'Summary', _SUMMARY_SHEET_HEADER, (
+            ('Forecast ID', forecast.forecast_id),
+            ('Generated At', figures['generated_at']),
+            ('Current Readiness', figures['current_readiness']),
+            ('Model Accuracy', figures['model_accuracy']),
+            ('Data Quality Score', figures['data_quality_score']),
+            ('Reliability', forecast.confidence_metrics.forecast_reliability.title())
+        ))
+        
+        # Projections Sheet
+        current_readiness = forecast.timeframe.current_readiness
+        self._append_sheet(workbook, header_format, 'Projections', _PROJECTIONS_SHEET_HEADER, chain(
+            [('Current', 0, current_readiness, current_readiness, current_readiness, 'Baseline')],
+            (
+                (
+                    f"{proj.days} days",
+                    proj.days,
+                    proj.readiness,
+                    proj.confidence_interval[0],
+                    proj.confidence_interval[1],
+                    proj.risk_level.title()
+                )
+                for proj in forecast.timeframe.projections
+            )
+        ))
+        
+        # Alerts Sheet
+        if forecast.critical_alerts:
+            self._append_sheet(workbook, header_format, 'Critical Alerts', _ALERTS_SHEET_HEADER, (
+                (
+                    alert.category,
+                    alert.expected_shortage_date,
+                    alert.severity.title(),
+                    alert.current_stock_level,
+                    alert.projected_need,
+                    ', '.join(alert.impacted_operations)
+                )
+                for alert in forecast.critical_alerts
+            ))
+        
+        # Procurement Sheet
+        if forecast.procurement_recommendations:
+            self._append_sheet(workbook, header_format, 'Procurement', _PROCUREMENT_SHEET_HEADER, (
+                (
+                    rec.priority.title(),
+                    rec.category,
+                    rec.recommended_quantity,
+                    rec.deadline,
+                    rec.supplier_lead_time,
+                    rec.rationale
+                )
+                for rec in forecast.procurement_recommendations
+            ))
+        
+        # Mitigation Strategies Sheet
+        if forecast.mitigation_strategies:
+            self._append_sheet(workbook, header_format, 'Mitigation Strategies', _MITIGATION_SHEET_HEADER, (
+                (
+                    strategy.strategy,
+                    strategy.effectiveness * 100,
+                    strategy.implementation_time,
+                    strategy.impact,
+                    ', '.join(strategy.items_affected)
+                )
+                for strategy in forecast.mitigation_strategies
+            ))
+        
+        workbook.close()
+
+    @staticmethod
+    def _append_sheet(
+        workbook: Workbook,
+        header_format: Format,
+        title: str,
+        header: Tuple[str, ...],
+        rows: Iterable[Tuple[Any, ...]]
+    ):
+        """Add a sheet with a header row followed by the given rows"""
+        sheet = workbook.add_worksheet(title)
+        sheet.write_row(0, 0, header, header_format)
+        for row_index, row in enumerate(rows, 1):
+            sheet.write_row(row_index, 0, row)
+
+    def _render_report(
+        self,
+        write_report: Callable[[ForecastResult, BinaryIO], None],
+        forecast: ForecastResult
+    ) -> bytes:
+        """Write a report to memory and return its bytes"""
+        cache_key = self._report_cache_key(write_report, forecast)
+        report = self._get_rendered_report(cache_key)
+        if report is None:
             buffer = BytesIO()
+            write_report(forecast, buffer)
+            report = buffer.getvalue()
+            self._remember_rendered_report(cache_key, report)
+        return report
+
+    async def _stream_report(
+        self,
+        write_report: Callable[[ForecastResult, BinaryIO], None],
+        forecast: ForecastResult
+    ) -> AsyncIterator[bytes]:
+        """Write a report to a spooled file and yield it back in chunks"""
+        cache_key = self._report_cache_key(write_report, forecast)
+        report = self._get_rendered_report(cache_key)
+        if report is not None:
+            for start in range(0, len(report), EXPORT_CHUNK_SIZE):
+                yield report[start:start + EXPORT_CHUNK_SIZE]
+            return
+        
+        with SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE) as spool:
+            await asyncio.to_thread(write_report, forecast, spool)
+            report_size = spool.tell()
+            spool.seek(0)
             
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                # Summary Sheet
-                summary_data = {
-                    'Metric': [
-                        'Forecast ID',
-                        'Generated At',
-                        'Current Readiness',
-                        'Model Accuracy', 
-                        'Data Quality Score',
-                        'Reliability'
-                    ],
-                    'Value': [
-                        forecast.forecast_id,
-                        forecast.generated_at.strftime('%Y-%m-%d %H:%M:%S'),
-                        f"{forecast.timeframe.current_readiness:.1f}%",
-                        f"{forecast.confidence_metrics.model_accuracy * 100:.1f}%",
-                        f"{forecast.confidence_metrics.data_quality_score * 100:.1f}%",
-                        forecast.confidence_metrics.forecast_reliability.title()
-                    ]
-                }
-                
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Projections Sheet
-                projections_data = []
-                projections_data.append({
-                    'Timeframe': 'Current',
-                    'Days': 0,
-                    'Readiness (%)': forecast.timeframe.current_readiness,
-                    'Lower Bound (%)': forecast.timeframe.current_readiness,
-                    'Upper Bound (%)': forecast.timeframe.current_readiness,
-                    'Risk Level': 'Baseline'
-                })
-                
-                for proj in forecast.timeframe.projections:
-                    projections_data.append({
-                        'Timeframe': f"{proj.days} days",
-                        'Days': proj.days,
-                        'Readiness (%)': proj.readiness,
-                        'Lower Bound (%)': proj.confidence_interval[0],
-                        'Upper Bound (%)': proj.confidence_interval[1],
-                        'Risk Level': proj.risk_level.title()
-                    })
-                
-                projections_df = pd.DataFrame(projections_data)
-                projections_df.to_excel(writer, sheet_name='Projections', index=False)
-                
-                # Alerts Sheet
-                if forecast.critical_alerts:
-                    alerts_data = []
-                    for alert in forecast.critical_alerts:
-                        alerts_data.append({
-                            'Category': alert.category,
-                            'Expected Shortage Date': alert.expected_shortage_date,
-                            'Severity': alert.severity.title(),
-                            'Current Stock Level': alert.current_stock_level,
-                            'Projected Need': alert.projected_need,
-                            'Impacted Operations': ', '.join(alert.impacted_operations)
-                        })
-                    
-                    alerts_df = pd.DataFrame(alerts_data)
-                    alerts_df.to_excel(writer, sheet_name='Critical Alerts', index=False)
-                
-                # Procurement Sheet
-                if forecast.procurement_recommendations:
-                    proc_data = []
-                    for rec in forecast.procurement_recommendations:
-                        proc_data.append({
-                            'Priority': rec.priority.title(),
-                            'Category': rec.category,
-                            'Recommended Quantity': rec.recommended_quantity,
-                            'Deadline': rec.deadline,
-                            'Supplier Lead Time (Days)': rec.supplier_lead_time,
-                            'Rationale': rec.rationale
-                        })
-                    
-                    proc_df = pd.DataFrame(proc_data)
-                    proc_df.to_excel(writer, sheet_name='Procurement', index=False)
-                
-                # Mitigation Strategies Sheet
-                if forecast.mitigation_strategies:
-                    mitigation_data = []
-                    for strategy in forecast.mitigation_strategies:
-                        mitigation_data.append({
-                            'Strategy': strategy.strategy,
-                            'Effectiveness (%)': strategy.effectiveness * 100,
-                            'Implementation Time (Days)': strategy.implementation_time,
-                            'Impact': strategy.impact,
-                            'Items Affected': ', '.join(strategy.items_affected)
-                        })
-                    
-                    mitigation_df = pd.DataFrame(mitigation_data)
-                    mitigation_df.to_excel(writer, sheet_name='Mitigation Strategies', index=False)
-            
-            buffer.seek(0)
-            return buffer.read()
+            # Keep small reports for repeat downloads; large ones are only ever streamed
+            if report_size <= RENDERED_REPORT_CACHE_MAX_BYTES:
+                self._remember_rendered_report(cache_key, spool.read())
+                spool.seek(0)
             
-        except Exception as e:
-            logger.error(f"Failed to generate Excel report: {e}")
-            raise
+            while chunk := spool.read(EXPORT_CHUNK_SIZE):
+                yield chunk
+
+    @staticmethod
+    def _report_cache_key(
+        write_report: Callable[[ForecastResult, BinaryIO], None],
+        forecast: ForecastResult
+    ) -> Tuple[str, str, str]:
+        """Key a rendered report by format and forecast; stored forecasts never change"""
+        return (write_report.__name__, forecast.forecast_id, forecast.generated_at.isoformat())
 
-    def _generate_projections_summary(self, forecast: ForecastResult) -> str:
+    def _get_rendered_report(self, cache_key: Tuple[str, str, str]) -> Optional[bytes]:
+        """Get a previously rendered report, marking it as recently used"""
+        with self._rendered_reports_lock:
+            report = self._rendered_reports.get(cache_key)
+            if report is not None:
+                self._rendered_reports.move_to_end(cache_key)
+            return report
+
+    def _remember_rendered_report(self, cache_key: Tuple[str, str, str], report: bytes):
+        """Store a rendered report, evicting the least recently used beyond the limit"""
+        with self._rendered_reports_lock:
+            self._rendered_reports[cache_key] = report
+            self._rendered_reports.move_to_end(cache_key)
+            while len(self._rendered_reports) > RENDERED_REPORT_CACHE_SIZE:
+                self._rendered_reports.popitem(last=False)
+
+    def _generate_projections_summary(self, forecast: ForecastResult, figures: Dict[str, str]) -> str:
         """Generate executive summary of projections"""
         current = forecast.timeframe.current_readiness
         
@@ -365,20 +553,21 @@ class ForecastExportService:
             else:
                 trend = "remain stable"
             
-            summary = f"""
-            Current readiness stands at {current:.1f}%. Over the next {final_projection.days} days, 
-            projections indicate readiness levels will {trend}, reaching {final_projection.readiness:.1f}% 
-            with a {final_projection.risk_level} risk assessment.
-            
-            The forecast shows {len(forecast.critical_alerts)} critical alert(s) and 
-            {len(forecast.procurement_recommendations)} procurement recommendation(s) requiring immediate attention.
-            Model confidence is {forecast.confidence_metrics.model_accuracy * 100:.0f}% with 
-            {forecast.confidence_metrics.forecast_reliability} reliability.
-            """
+            summary = _PROJECTIONS_SUMMARY_TEMPLATE.substitute(
+                current=figures['current_readiness'],
+                days=final_projection.days,
+                trend=trend,
+                final=f"{final_projection.readiness:.1f}",
+                risk=final_projection.risk_level.value,
+                alerts=len(forecast.critical_alerts),
+                recommendations=len(forecast.procurement_recommendations),
+                confidence=figures['confidence'],
+                reliability=forecast.confidence_metrics.forecast_reliability
+            )
         else:
-            summary = f"""
-            Current readiness stands at {current:.1f}%. Insufficient projection data available 
-            for detailed forecasting. {len(forecast.critical_alerts)} critical alert(s) identified.
-            """
+            summary = _NO_PROJECTIONS_SUMMARY_TEMPLATE.substitute(
+                current=figures['current_readiness'],
+                alerts=len(forecast.critical_alerts)
+            )
         
-        return summary.strip()
\ No newline at end of file
+        return summary
\ No newline at end of file
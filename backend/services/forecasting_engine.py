@@ -1,15 +1,21 @@
 """
 Predictive Readiness Forecasting Engine for TLDM BITS
 """
-import json
 import os
 import logging
-from typing import List, Dict, Any, Optional
+import hashlib
+import random
+import time
+from collections import OrderedDict, defaultdict
+from typing import List, Dict, Any, Final, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
-from statistics import mean, stdev
+from statistics import mean
 import math
+from string import Template
 import asyncio
 
+import numpy as np
+import orjson
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 from models.forecasting import (
     ForecastingInput, ForecastResult, TimeframeProjections, ReadinessProjection,
@@ -20,59 +26,8 @@ from models.forecasting import (
 
 logger = logging.getLogger(__name__)
 
-
-class ReadinessForecaster:
-    """Core forecasting engine with AI-powered predictions"""
-    
-    def __init__(self):
-        self.api_key = os.environ.get('EMERGENT_LLM_KEY')
-        if not self.api_key:
-            raise ValueError("EMERGENT_LLM_KEY not found in environment variables")
-    
-    async def generate_forecast(self, input_data: ForecastingInput) -> ForecastResult:
-        """Generate comprehensive readiness forecast"""
-        try:
-            # Generate AI forecast
-            ai_forecast = await self._generate_ai_forecast(input_data)
-            return ai_forecast
-        except Exception as error:
-            logger.warning(f"AI forecasting failed: {error}")
-            # Fall back to rule-based forecast
-            return self._generate_fallback_forecast(input_data)
-    
-    async def _generate_ai_forecast(self, input_data: ForecastingInput) -> ForecastResult:
-        """Generate AI-powered forecast using LLM"""
-        
-        # Create unique session ID for this forecast
-        session_id = f"forecast_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        # Initialize AI chat with system message
-        chat = LlmChat(
-            api_key=self.api_key,
-            session_id=session_id,
-            system_message=self._get_system_prompt()
-        ).with_model("openai", "gpt-5")
-        
-        # Build the forecasting prompt
-        user_prompt = self._build_forecasting_prompt(input_data)
-        
-        # Create user message
-        user_message = UserMessage(text=user_prompt)
-        
-        # Get AI response
-        response = await chat.send_message(user_message)
-        
-        # Parse and validate AI response
-        try:
-            forecast_data = json.loads(response)
-            return self._validate_and_parse_response(forecast_data, input_data)
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"Failed to parse AI response: {e}")
-            return self._generate_fallback_forecast(input_data)
-    
-    def _get_system_prompt(self) -> str:
-        """Get the enhanced system prompt for AI forecasting"""
-        return """You are an advanced predictive analytics engine for the Royal Malaysian Navy (TLDM) ordnance readiness forecasting. You specialize in naval warfare logistics, ordnance consumption patterns, and strategic defense planning.
+# System prompt sent with every AI forecast
+_SYSTEM_PROMPT: Final[str] = """You are an advanced predictive analytics engine for the Royal Malaysian Navy (TLDM) ordnance readiness forecasting. You specialize in naval warfare logistics, ordnance consumption patterns, and strategic defense planning.
 
         EXPERTISE AREAS:
         - Naval ordnance lifecycle management and consumption modeling
@@ -103,36 +58,27 @@ class ReadinessForecaster:
         - Include sensitivity analysis for key input variables
 
         Always respond with valid JSON matching the required schema. Use conservative estimates to ensure mission readiness."""
-    
-    def _build_forecasting_prompt(self, input_data: ForecastingInput) -> str:
-        """Build the detailed forecasting prompt"""
-        
-        # Summarize input data
-        usage_summary = self._summarize_usage_trends(input_data.usage_trends)
-        exercise_summary = self._summarize_exercises(input_data.scheduled_exercises)
-        supply_summary = self._summarize_supply_chain(input_data.lead_times)
-        historical_summary = self._summarize_historical(input_data.historical_patterns)
-        inventory_summary = self._summarize_inventory(input_data.inventory_snapshot)
-        
-        prompt = f"""
-CURRENT READINESS: {input_data.current_readiness}%
+
+# Forecasting request prompt; only the current readiness and the input summaries vary per forecast
+_FORECASTING_PROMPT_TEMPLATE: Final[Template] = Template("""
+CURRENT READINESS: $current_readiness%
 TIME HORIZON: 30/60/90 days
 FORECASTING REQUEST: Generate comprehensive readiness projections with actionable recommendations
 
 USAGE TRENDS (Last 180 days):
-{usage_summary}
+$usage_summary
 
 SCHEDULED EXERCISES:
-{exercise_summary}
+$exercise_summary
 
 SUPPLY CHAIN STATUS:
-{supply_summary}
+$supply_summary
 
 HISTORICAL PATTERNS:
-{historical_summary}
+$historical_summary
 
 CURRENT INVENTORY:
-{inventory_summary}
+$inventory_summary
 
 GENERATE FORECAST WITH:
 1. Readiness projections for 30, 60, 90 days with confidence intervals
@@ -142,127 +88,375 @@ GENERATE FORECAST WITH:
 5. Mitigation strategies for identified risks
 
 RESPONSE FORMAT: Return valid JSON with this structure:
-{{
-    "timeframe": {{
-        "current_readiness": {input_data.current_readiness},
+{
+    "timeframe": {
+        "current_readiness": $current_readiness,
         "projections": [
-            {{
+            {
                 "days": 30,
                 "readiness": <percentage>,
                 "confidence_interval": [<lower>, <upper>],
                 "risk_level": "<low|medium|high|critical>"
-            }},
-            {{
+            },
+            {
                 "days": 60,
                 "readiness": <percentage>,
                 "confidence_interval": [<lower>, <upper>],
                 "risk_level": "<low|medium|high|critical>"
-            }},
-            {{
+            },
+            {
                 "days": 90,
                 "readiness": <percentage>,
                 "confidence_interval": [<lower>, <upper>],
                 "risk_level": "<low|medium|high|critical>"
-            }}
+            }
         ]
-    }},
+    },
     "critical_alerts": [
-        {{
+        {
             "category": "<ordnance_category>",
             "expected_shortage_date": "<YYYY-MM-DD>",
             "severity": "<low|medium|high|critical>",
             "impacted_operations": ["<operation_names>"],
             "current_stock_level": <number>,
             "projected_need": <number>
-        }}
+        }
     ],
     "procurement_recommendations": [
-        {{
+        {
             "priority": "<urgent|high|medium|low>",
             "category": "<ordnance_category>",
             "recommended_quantity": <number>,
             "deadline": "<YYYY-MM-DD>",
             "rationale": "<explanation>",
             "supplier_lead_time": <days>
-        }}
+        }
     ],
     "operation_impact_assessment": [
-        {{
+        {
             "exercise_name": "<exercise_name>",
             "readiness_impact": <percentage_change>,
             "critical_items_affected": ["<ordnance_names>"],
             "recommendations": ["<action_items>"]
-        }}
+        }
     ],
     "mitigation_strategies": [
-        {{
+        {
             "strategy": "<strategy_name>",
             "effectiveness": <0-1>,
             "implementation_time": <days>,
             "impact": "<impact_description>",
             "items_affected": ["<ordnance_categories>"]
-        }}
+        }
     ],
-    "confidence_metrics": {{
+    "confidence_metrics": {
         "model_accuracy": <0-1>,
         "data_quality_score": <0-1>,
         "forecast_reliability": "<high|medium|low>"
-    }}
-}}
+    }
+}
 
 Be conservative in projections. Prioritize shortage prevention over cost optimization.
-"""
-        return prompt
+""")
+
+# Upper bound on forecasts requested from the LLM at once within a batch, tunable to the provider's rate limits
+BATCH_MAX_CONCURRENCY = int(os.environ.get('EMERGENT_LLM_CONCURRENCY', '4'))
+
+# Consumption multiplier while an exercise of each intensity is running
+_INTENSITY_MULTIPLIERS: Final[Dict[str, float]] = {'low': 1.2, 'medium': 1.5, 'high': 2.0, 'critical': 3.0}
+
+# Readiness bands for rule-based risk levels: below 50% critical, below 65% high, below 80% medium
+_RISK_THRESHOLDS: Final[Tuple[float, ...]] = (50, 65, 80)
+_RISK_LEVELS: Final[Tuple[RiskLevel, ...]] = (RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW)
+
+# Enum members by the values the AI responds with; unknown values fall back to medium
+_RISK_LEVELS_BY_VALUE: Final[Dict[str, RiskLevel]] = {level.value: level for level in RiskLevel}
+_ALERT_SEVERITIES_BY_VALUE: Final[Dict[str, AlertSeverity]] = {severity.value: severity for severity in AlertSeverity}
+
+# Input rows above which prompt summaries are built in worker threads rather than on the event loop
+PROMPT_SUMMARY_THREAD_MIN_ROWS = 500
+
+# Attempts per LLM request on transient failures, the first backoff delay, and the total time a
+# request may spend before another retry is given up on; kept within the routes' 5s forecast timeout
+AI_SEND_MAX_ATTEMPTS = 3
+AI_SEND_RETRY_BASE_DELAY_SECONDS = 0.25
+AI_SEND_RETRY_BUDGET_SECONDS = 4.0
+
+# HTTP statuses the LLM client reports for rate limiting and provider-side failures
+_TRANSIENT_LLM_STATUS_CODES: Final = frozenset({408, 429, 500, 502, 503, 504})
+
+# AI response sections that hold lists of row objects
+_RESPONSE_ROW_SECTIONS: Final[Tuple[str, ...]] = (
+    'critical_alerts', 'procurement_recommendations', 'operation_impact_assessment', 'mitigation_strategies'
+)
+
+# Metadata recorded with each kind of engine forecast; copied per forecast since routes add to it
+_AI_FORECAST_METADATA: Final[Dict[str, Any]] = {
+    'generated_as': 'ai_service',
+    'ai_model': 'gpt-5',
+    'processing_time_ms': 0,
+    'data_quality': 'high'
+}
+_FALLBACK_FORECAST_METADATA: Final[Dict[str, Any]] = {
+    'generated_as': 'fallback_rule_based',
+    'ai_model': 'none',
+    'processing_time_ms': 0,
+    'data_quality': 'limited'
+}
+
+# AI forecasts kept per server process for identical inputs (e.g. a polling dashboard), and for how long
+AI_FORECAST_CACHE_SIZE = 256
+AI_FORECAST_CACHE_TTL_SECONDS = 600
+
+# Input digest -> (expiry, forecast fields without its ID and timestamp)
+_ai_forecast_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+
+def _is_transient_llm_error(error: BaseException) -> bool:
+    """Whether an LLM client error is worth retrying: connection trouble, rate limits or 5xx responses"""
+    # The client surfaces provider errors as its own exception types, which carry the HTTP status
+    # directly or on their response, sometimes wrapped in another exception
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return True
+        status_code = getattr(error, 'status_code', None)
+        if status_code is None:
+            status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+        if status_code in _TRANSIENT_LLM_STATUS_CODES:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _as_dict(row: Any) -> Dict[str, Any]:
+    """View an input row (a model or an already-serialized dict) as a field dict"""
+    return row if isinstance(row, dict) else row.__dict__
+
+
+class UsageTrendFrame(NamedTuple):
+    """Usage trend rows laid out as one array per field"""
+    category: np.ndarray
+    quantity: np.ndarray
+    
+    @classmethod
+    def from_rows(cls, usage_trends: List[Any]) -> "UsageTrendFrame":
+        """Read models or dicts into per-field arrays in a single pass"""
+        count = len(usage_trends)
+        category = np.empty(count, dtype=object)
+        quantity = np.empty(count, dtype=np.float64)
+        for i, usage in enumerate(map(_as_dict, usage_trends)):
+            category[i] = usage.get('category', 'Unknown')
+            quantity[i] = usage.get('quantity_used', 0)
+        return cls(category, quantity)
+
+
+def _check_response_structure(forecast_data: Any):
+    """Reject an AI response that does not follow the requested JSON structure"""
+    if not isinstance(forecast_data, dict):
+        raise ValueError("AI response is not a JSON object")
+    
+    timeframe_data = forecast_data.get('timeframe')
+    projections = timeframe_data.get('projections') if isinstance(timeframe_data, dict) else None
+    if not isinstance(projections, list) or not projections:
+        raise ValueError("AI response has no readiness projections")
+    
+    sections = {'projections': projections}
+    sections.update((section, forecast_data.get(section, [])) for section in _RESPONSE_ROW_SECTIONS)
+    for section, rows in sections.items():
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError(f"AI response {section} is not a list of objects")
+    
+    if not isinstance(forecast_data.get('confidence_metrics', {}), dict):
+        raise ValueError("AI response confidence_metrics is not an object")
+
+
+class ReadinessForecaster:
+    """Core forecasting engine with AI-powered predictions"""
+    
+    def __init__(self):
+        self.api_key = os.environ.get('EMERGENT_LLM_KEY')
+        if not self.api_key:
+            raise ValueError("EMERGENT_LLM_KEY not found in environment variables")
+    
+    async def generate_forecast(self, input_data: ForecastingInput) -> ForecastResult:
+        """Generate comprehensive readiness forecast"""
+        try:
+            # Generate AI forecast
+            ai_forecast = await self._generate_ai_forecast(input_data)
+            return ai_forecast
+        except Exception as error:
+            logger.warning(f"AI forecasting failed: {error}")
+            # Fall back to rule-based forecast, built off the event loop
+            return await asyncio.to_thread(self._generate_fallback_forecast, input_data)
+    
+    async def generate_forecast_batch(
+        self,
+        inputs: List[ForecastingInput],
+        max_concurrency: int = BATCH_MAX_CONCURRENCY
+    ) -> List[ForecastResult]:
+        """Generate forecasts for several inputs (e.g. scenario variants) concurrently"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate_bounded(input_data: ForecastingInput) -> ForecastResult:
+            async with semaphore:
+                return await self.generate_forecast(input_data)
+        
+        # generate_forecast never raises, so every input yields a result
+        return list(await asyncio.gather(*(generate_bounded(input_data) for input_data in inputs)))
+    
+    async def _generate_ai_forecast(self, input_data: ForecastingInput) -> ForecastResult:
+        """Generate AI-powered forecast using LLM"""
+        started_ns = time.perf_counter_ns()
+        
+        # Identical inputs reuse a recent AI forecast, reissued under a new ID and timestamp
+        cache_key = self._forecast_cache_key(input_data)
+        cached_fields = self._get_cached_forecast(cache_key)
+        if cached_fields is not None:
+            return ForecastResult(**cached_fields)
+        
+        # Create unique session ID for this forecast
+        session_id = f"forecast_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
+        # Initialize AI chat with system message
+        chat = LlmChat(
+            api_key=self.api_key,
+            session_id=session_id,
+            system_message=self._get_system_prompt()
+        ).with_model("openai", "gpt-5")
+        
+        # Build the forecasting prompt
+        user_prompt = await self._build_forecasting_prompt(input_data)
+        
+        # Create user message
+        user_message = UserMessage(text=user_prompt)
+        
+        # Get AI response
+        response = await self._send_with_retry(chat, user_message)
+        
+        # Parse and validate AI response off the event loop; the LLM round-trip itself stays on it
+        try:
+            forecast_result = await asyncio.to_thread(self._parse_ai_response, response, input_data)
+        except (orjson.JSONDecodeError, ValueError) as e:
+            logger.error(f"Failed to parse AI response: {e}")
+            return await asyncio.to_thread(self._generate_fallback_forecast, input_data)
+        
+        forecast_result.metadata['processing_time_ms'] = (time.perf_counter_ns() - started_ns) // 1_000_000
+        self._remember_forecast(cache_key, forecast_result)
+        return forecast_result
+    
+    async def _send_with_retry(self, chat: LlmChat, user_message: UserMessage) -> str:
+        """Send a message to the LLM, retrying transient failures with jittered backoff"""
+        deadline = time.monotonic() + AI_SEND_RETRY_BUDGET_SECONDS
+        for attempt in range(1, AI_SEND_MAX_ATTEMPTS + 1):
+            try:
+                return await chat.send_message(user_message)
+            except Exception as error:
+                delay = AI_SEND_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1) * random.uniform(0.5, 1.0)
+                if (attempt == AI_SEND_MAX_ATTEMPTS or not _is_transient_llm_error(error)
+                        or time.monotonic() + delay >= deadline):
+                    raise
+                logger.warning(f"AI request attempt {attempt} failed: {error}; retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _forecast_cache_key(input_data: ForecastingInput) -> str:
+        """Stable digest of a forecasting input"""
+        payload = orjson.dumps(input_data.model_dump(), default=str, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _get_cached_forecast(cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get the fields of a cached AI forecast, dropping it once expired"""
+        entry = _ai_forecast_cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, forecast_fields = entry
+        if expires_at <= time.monotonic():
+            del _ai_forecast_cache[cache_key]
+            return None
+        _ai_forecast_cache.move_to_end(cache_key)
+        return forecast_fields
+    
+    @staticmethod
+    def _remember_forecast(cache_key: str, forecast: ForecastResult):
+        """Cache an AI forecast, evicting the least recently used beyond the limit"""
+        _ai_forecast_cache[cache_key] = (
+            time.monotonic() + AI_FORECAST_CACHE_TTL_SECONDS,
+            forecast.model_dump(exclude={'forecast_id', 'generated_at'})
+        )
+        _ai_forecast_cache.move_to_end(cache_key)
+        while len(_ai_forecast_cache) > AI_FORECAST_CACHE_SIZE:
+            _ai_forecast_cache.popitem(last=False)
+    
+    def _get_system_prompt(self) -> str:
+        """Get the enhanced system prompt for AI forecasting"""
+        return _SYSTEM_PROMPT
+    
+    async def _build_forecasting_prompt(self, input_data: ForecastingInput) -> str:
+        """Build the detailed forecasting prompt"""
+        
+        # Summarize input data, off the event loop when there is enough of it to hold up other forecasts
+        summary_jobs = (
+            (self._summarize_usage_trends, input_data.usage_trends),
+            (self._summarize_exercises, input_data.scheduled_exercises),
+            (self._summarize_supply_chain, input_data.lead_times),
+            (self._summarize_historical, input_data.historical_patterns),
+            (self._summarize_inventory, input_data.inventory_snapshot)
+        )
+        if sum(len(rows) for _, rows in summary_jobs) > PROMPT_SUMMARY_THREAD_MIN_ROWS:
+            summaries = await asyncio.gather(*(asyncio.to_thread(summarize, rows) for summarize, rows in summary_jobs))
+        else:
+            summaries = [summarize(rows) for summarize, rows in summary_jobs]
+        usage_summary, exercise_summary, supply_summary, historical_summary, inventory_summary = summaries
+        
+        return _FORECASTING_PROMPT_TEMPLATE.substitute(
+            current_readiness=input_data.current_readiness,
+            usage_summary=usage_summary,
+            exercise_summary=exercise_summary,
+            supply_summary=supply_summary,
+            historical_summary=historical_summary,
+            inventory_summary=inventory_summary
+        )
     
     def _summarize_usage_trends(self, usage_trends: List[Any]) -> str:
         """Summarize usage trend data"""
         if not usage_trends:
             return "No historical usage data available"
         
-        categories = {}
-        for usage in usage_trends:
-            cat = usage.category if hasattr(usage, 'category') else usage.get('category', 'Unknown')
-            qty = usage.quantity_used if hasattr(usage, 'quantity_used') else usage.get('quantity_used', 0)
-            
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(qty)
-        
-        summary = []
-        for category, quantities in categories.items():
-            avg_usage = mean(quantities) if quantities else 0
-            total_usage = sum(quantities)
-            summary.append(f"- {category}: Avg {avg_usage:.1f}/period, Total {total_usage}")
-        
-        return "\n".join(summary)
+        # Group by category, listing categories in order of first appearance
+        frame = UsageTrendFrame.from_rows(usage_trends)
+        categories, first_index, inverse = np.unique(frame.category, return_index=True, return_inverse=True)
+        totals = np.bincount(inverse, weights=frame.quantity)
+        counts = np.bincount(inverse)
+        
+        return "\n".join(
+            f"- {categories[i]}: Avg {totals[i] / counts[i]:.1f}/period, Total {totals[i]:.0f}"
+            for i in np.argsort(first_index).tolist()
+        )
     
     def _summarize_exercises(self, exercises: List[Any]) -> str:
         """Summarize scheduled exercises"""
         if not exercises:
             return "No scheduled exercises"
         
-        summary = []
-        for exercise in exercises:
-            name = exercise.name if hasattr(exercise, 'name') else exercise.get('name', 'Unknown')
-            intensity = exercise.intensity if hasattr(exercise, 'intensity') else exercise.get('intensity', 'medium')
-            start = exercise.start_date if hasattr(exercise, 'start_date') else exercise.get('start_date', 'TBD')
-            summary.append(f"- {name} ({intensity} intensity, starts {start})")
-        
-        return "\n".join(summary)
+        return "\n".join(
+            f"- {exercise.get('name', 'Unknown')} ({exercise.get('intensity', 'medium')} intensity, "
+            f"starts {exercise.get('start_date', 'TBD')})"
+            for exercise in map(_as_dict, exercises)
+        )
     
     def _summarize_supply_chain(self, supply_data: List[Any]) -> str:
         """Summarize supply chain information"""
         if not supply_data:
             return "No supply chain data available"
         
-        summary = []
-        for supply in supply_data:
-            cat = supply.category if hasattr(supply, 'category') else supply.get('category', 'Unknown')
-            lead_time = supply.average_lead_time if hasattr(supply, 'average_lead_time') else supply.get('average_lead_time', 0)
-            reliability = supply.supplier_reliability if hasattr(supply, 'supplier_reliability') else supply.get('supplier_reliability', 0)
-            summary.append(f"- {cat}: {lead_time} days lead time, {reliability}% reliability")
-        
-        return "\n".join(summary)
+        return "\n".join(
+            f"- {supply.get('category', 'Unknown')}: {supply.get('average_lead_time', 0)} days lead time, "
+            f"{supply.get('supplier_reliability', 0)}% reliability"
+            for supply in map(_as_dict, supply_data)
+        )
     
     def _summarize_historical(self, historical_data: List[Any]) -> str:
         """Summarize historical patterns"""
@@ -272,9 +466,9 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
         readiness_values = []
         consumption_values = []
         
-        for data in historical_data:
-            readiness = data.readiness if hasattr(data, 'readiness') else data.get('readiness', 0)
-            consumption = data.consumption if hasattr(data, 'consumption') else data.get('consumption', 0)
+        for data in map(_as_dict, historical_data):
+            readiness = data.get('readiness', 0)
+            consumption = data.get('consumption', 0)
             readiness_values.append(readiness)
             consumption_values.append(consumption)
         
@@ -288,24 +482,27 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
         if not inventory_data:
             return "No inventory data available"
         
-        categories = {}
-        for item in inventory_data:
-            cat = item.ordnance_category if hasattr(item, 'ordnance_category') else item.get('ordnance_category', 'Unknown')
-            qty = item.quantity if hasattr(item, 'quantity') else item.get('quantity', 0)
-            
-            if cat not in categories:
-                categories[cat] = 0
-            categories[cat] += qty
-        
-        summary = []
-        for category, total_qty in categories.items():
-            summary.append(f"- {category}: {total_qty} units")
+        categories = defaultdict(int)
+        for item in map(_as_dict, inventory_data):
+            categories[item.get('ordnance_category', 'Unknown')] += item.get('quantity', 0)
         
-        return "\n".join(summary)
+        return "\n".join(f"- {category}: {total_qty} units" for category, total_qty in categories.items())
+    
+    def _parse_ai_response(self, response: str, input_data: ForecastingInput) -> ForecastResult:
+        """Decode a raw AI response and parse it into a ForecastResult"""
+        return self._validate_and_parse_response(orjson.loads(response), input_data)
     
     def _validate_and_parse_response(self, forecast_data: Dict[str, Any], input_data: ForecastingInput) -> ForecastResult:
         """Validate and parse AI response into ForecastResult"""
         
+        # Fall back early on malformed output instead of filling it with defaults
+        _check_response_structure(forecast_data)
+        
+        # Dates used when the AI leaves them out; .get evaluates its default for every row
+        now = datetime.now()
+        default_shortage_date = (now + timedelta(days=30)).strftime('%Y-%m-%d')
+        default_deadline = (now + timedelta(days=60)).strftime('%Y-%m-%d')
+        
         # Parse timeframe projections
         timeframe_data = forecast_data.get('timeframe', {})
         projections = []
@@ -315,7 +512,7 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
                 days=proj_data.get('days', 30),
                 readiness=proj_data.get('readiness', input_data.current_readiness),
                 confidence_interval=proj_data.get('confidence_interval', [70, 90]),
-                risk_level=RiskLevel(proj_data.get('risk_level', 'medium'))
+                risk_level=_RISK_LEVELS_BY_VALUE.get(proj_data.get('risk_level'), RiskLevel.MEDIUM)
             )
             projections.append(projection)
         
@@ -329,9 +526,8 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
         for alert_data in forecast_data.get('critical_alerts', []):
             alert = CriticalAlert(
                 category=alert_data.get('category', 'Unknown'),
-                expected_shortage_date=alert_data.get('expected_shortage_date', 
-                                                     (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')),
-                severity=AlertSeverity(alert_data.get('severity', 'medium')),
+                expected_shortage_date=alert_data.get('expected_shortage_date', default_shortage_date),
+                severity=_ALERT_SEVERITIES_BY_VALUE.get(alert_data.get('severity'), AlertSeverity.MEDIUM),
                 impacted_operations=alert_data.get('impacted_operations', []),
                 current_stock_level=alert_data.get('current_stock_level', 0),
                 projected_need=alert_data.get('projected_need', 0)
@@ -345,7 +541,7 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
                 priority=rec_data.get('priority', 'medium'),
                 category=rec_data.get('category', 'Unknown'),
                 recommended_quantity=rec_data.get('recommended_quantity', 0),
-                deadline=rec_data.get('deadline', (datetime.now() + timedelta(days=60)).strftime('%Y-%m-%d')),
+                deadline=rec_data.get('deadline', default_deadline),
                 rationale=rec_data.get('rationale', 'AI recommendation'),
                 supplier_lead_time=rec_data.get('supplier_lead_time', 30)
             )
@@ -390,12 +586,7 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
             operation_impact_assessment=operation_impact,
             mitigation_strategies=mitigation_strategies,
             confidence_metrics=confidence_metrics,
-            metadata={
-                'generated_as': 'ai_service',
-                'ai_model': 'gpt-5',
-                'processing_time_ms': 0,
-                'data_quality': 'high'
-            }
+            metadata=_AI_FORECAST_METADATA.copy()
         )
         
         return forecast_result
@@ -405,43 +596,40 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
         
         logger.info("Generating fallback forecast using rule-based approach")
         
+        # Every value below is computed here rather than taken from the AI, so models skip validation
+        
         current_readiness = input_data.current_readiness
+        now = datetime.now()
         
         # Simple linear projection with conservative estimates
-        projections = []
+        horizons = np.array([30, 60, 90])
         
         # Calculate trend based on historical data or assume slight decline
         trend_decline = -0.5  # Conservative 0.5% decline per month
+        projected_readiness = np.maximum(0.0, current_readiness + trend_decline * (horizons / 30))
         
-        for days in [30, 60, 90]:
-            months = days / 30
-            projected_readiness = max(0, current_readiness + (trend_decline * months))
-            
-            # Add confidence intervals
-            margin = 5.0  # ±5% confidence interval
-            confidence_interval = [
-                max(0, projected_readiness - margin),
-                min(100, projected_readiness + margin)
-            ]
-            
-            # Determine risk level
-            risk_level = RiskLevel.LOW
-            if projected_readiness < 50:
-                risk_level = RiskLevel.CRITICAL
-            elif projected_readiness < 65:
-                risk_level = RiskLevel.HIGH
-            elif projected_readiness < 80:
-                risk_level = RiskLevel.MEDIUM
-            
-            projection = ReadinessProjection(
+        # Add confidence intervals
+        margin = 5.0  # ±5% confidence interval
+        lower_bounds = np.maximum(0.0, projected_readiness - margin)
+        upper_bounds = np.minimum(100.0, projected_readiness + margin)
+        
+        # Determine risk levels
+        risk_indices = np.searchsorted(_RISK_THRESHOLDS, projected_readiness, side='right')
+        
+        projections = [
+            ReadinessProjection.model_construct(
                 days=days,
-                readiness=projected_readiness,
-                confidence_interval=confidence_interval,
-                risk_level=risk_level
+                readiness=readiness,
+                confidence_interval=[lower, upper],
+                risk_level=_RISK_LEVELS[risk_index]
             )
-            projections.append(projection)
+            for days, readiness, lower, upper, risk_index in zip(
+                horizons.tolist(), projected_readiness.tolist(), lower_bounds.tolist(),
+                upper_bounds.tolist(), risk_indices.tolist()
+            )
+        ]
         
-        timeframe = TimeframeProjections(
+        timeframe = TimeframeProjections.model_construct(
             current_readiness=current_readiness,
             projections=projections
         )
@@ -449,9 +637,9 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
         # Generate basic alerts for low readiness
         critical_alerts = []
         if any(p.readiness < 70 for p in projections):
-            alert = CriticalAlert(
+            alert = CriticalAlert.model_construct(
                 category="General Ordnance",
-                expected_shortage_date=(datetime.now() + timedelta(days=45)).strftime('%Y-%m-%d'),
+                expected_shortage_date=(now + timedelta(days=45)).strftime('%Y-%m-%d'),
                 severity=AlertSeverity.MEDIUM,
                 impacted_operations=["Standard Operations"],
                 current_stock_level=int(current_readiness),
@@ -462,11 +650,11 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
         # Basic procurement recommendations
         procurement_recommendations = []
         if current_readiness < 80:
-            rec = ProcurementRecommendation(
+            rec = ProcurementRecommendation.model_construct(
                 priority="high",
                 category="Critical Ordnance",
                 recommended_quantity=100,
-                deadline=(datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d'),
+                deadline=(now + timedelta(days=30)).strftime('%Y-%m-%d'),
                 rationale="Fallback recommendation to maintain readiness above 80%",
                 supplier_lead_time=30
             )
@@ -474,7 +662,7 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
         
         # Basic mitigation strategy
         mitigation_strategies = [
-            MitigationStrategy(
+            MitigationStrategy.model_construct(
                 strategy="Inventory Optimization",
                 effectiveness=0.7,
                 implementation_time=14,
@@ -484,25 +672,20 @@ Be conservative in projections. Prioritize shortage prevention over cost optimiz
         ]
         
         # Conservative confidence metrics
-        confidence_metrics = ConfidenceMetrics(
+        confidence_metrics = ConfidenceMetrics.model_construct(
             model_accuracy=0.70,
             data_quality_score=0.65,
             forecast_reliability="medium"
         )
         
-        return ForecastResult(
+        return ForecastResult.model_construct(
             timeframe=timeframe,
             critical_alerts=critical_alerts,
             procurement_recommendations=procurement_recommendations,
             operation_impact_assessment=[],
             mitigation_strategies=mitigation_strategies,
             confidence_metrics=confidence_metrics,
-            metadata={
-                'generated_as': 'fallback_rule_based',
-                'ai_model': 'none',
-                'processing_time_ms': 0,
-                'data_quality': 'limited'
-            }
+            metadata=_FALLBACK_FORECAST_METADATA.copy()
         )
 
 
@@ -522,22 +705,19 @@ class TimeSeriesAnalyzer:
             )
         
         # Extract quantities
-        quantities = []
-        for usage in usage_data:
-            qty = usage.quantity_used if hasattr(usage, 'quantity_used') else usage.get('quantity_used', 0)
-            quantities.append(qty)
+        quantities = UsageTrendFrame.from_rows(usage_data).quantity
         
         # Calculate base consumption rate
-        base_consumption_rate = mean(quantities) if quantities else 0
+        base_consumption_rate = float(quantities.mean())
         
         # Calculate volatility (standard deviation)
-        volatility = stdev(quantities) if len(quantities) > 1 else 0
+        volatility = float(quantities.std(ddof=1)) if len(quantities) > 1 else 0
         
         # Determine trend direction (simplified)
         trend_direction = 'stable'
         if len(quantities) >= 5:
-            first_half = mean(quantities[:len(quantities)//2])
-            second_half = mean(quantities[len(quantities)//2:])
+            first_half = quantities[:len(quantities)//2].mean()
+            second_half = quantities[len(quantities)//2:].mean()
             if second_half > first_half * 1.1:
                 trend_direction = 'increasing'
             elif second_half < first_half * 0.9:
@@ -550,7 +730,7 @@ class TimeSeriesAnalyzer:
         anomaly_flags = []
         if volatility > 0:
             threshold = base_consumption_rate + (2 * volatility)
-            anomalous_count = sum(1 for q in quantities if q > threshold)
+            anomalous_count = int(np.count_nonzero(quantities > threshold))
             if anomalous_count > 0:
                 anomaly_flags.append(f"{anomalous_count} anomalous consumption periods detected")
         
@@ -568,15 +748,12 @@ class TimeSeriesAnalyzer:
         
         base_consumption = pattern.base_consumption_rate * (days / 30)  # Monthly to period
         
-        # Adjust for exercises
+        # Adjust for exercises; assume each exercise lasts 1 week and affects consumption
+        weekly_consumption = base_consumption * (7 / days)
         exercise_impact = 0
-        for exercise in exercises:
-            intensity_multipliers = {'low': 1.2, 'medium': 1.5, 'high': 2.0, 'critical': 3.0}
-            intensity = exercise.intensity if hasattr(exercise, 'intensity') else exercise.get('intensity', 'medium')
-            multiplier = intensity_multipliers.get(intensity, 1.5)
-            
-            # Assume exercise lasts 1 week and affects consumption
-            exercise_impact += base_consumption * (multiplier - 1) * (7 / days)
+        for exercise in map(_as_dict, exercises):
+            multiplier = _INTENSITY_MULTIPLIERS.get(exercise.get('intensity', 'medium'), 1.5)
+            exercise_impact += weekly_consumption * (multiplier - 1)
         
         projected_consumption = base_consumption + exercise_impact
         
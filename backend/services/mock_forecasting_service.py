@@ -3,10 +3,12 @@ Mock Forecasting Service for Demo and Fallback
 Provides realistic sample data when AI service is unavailable
 """
 import uuid
-from datetime import datetime, timedelta
-from typing import List
-import random
-import math
+from functools import lru_cache
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import orjson
 
 from models.forecasting import (
     ForecastResult, TimeframeProjections, ReadinessProjection,
@@ -15,36 +17,246 @@ from models.forecasting import (
     AlertSeverity, RiskLevel
 )
 
+# Seed used when a mock service is created without one
+MOCK_DEFAULT_SEED = 42
+
+# Mock forecasts are reused per readiness bucket (in percentage points), horizon and day
+MOCK_FORECAST_CACHE_SIZE = 64
+MOCK_READINESS_BUCKET = 0.5
+
+# Readiness projection horizons in days
+_PROJECTION_DAYS = np.array([30, 60, 90])
+
+# Seasonal readiness variation at each projection horizon
+_SEASONAL_FACTORS = np.sin((_PROJECTION_DAYS / 365.0) * 2 * np.pi) * 2
+
+# Readiness bands for risk levels: below 50% critical, below 65% high, below 80% medium
+_RISK_THRESHOLDS = (50, 65, 80)
+_RISK_LEVELS = (RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW)
+
+# Alert severity by worst projected readiness: below 50% critical, below 60% high, otherwise medium
+_ALERT_SEVERITY_THRESHOLDS = (50, 60)
+_ALERT_SEVERITIES = (AlertSeverity.CRITICAL, AlertSeverity.HIGH, AlertSeverity.MEDIUM)
+
+# Scenario timeline risk: below 60% high, otherwise medium
+_SCENARIO_RISK_THRESHOLD = 60
+_SCENARIO_RISK_LEVELS = (RiskLevel.HIGH, RiskLevel.MEDIUM)
+
+# Categories that might have shortages, and the operations an alert can impact (sampled as an object array)
+_ORDNANCE_CATEGORIES = (
+    "EXOCET MM40 Missile",
+    "A244S Torpedo",
+    "RDS 76MM Naval Gun",
+    "RDS 5.56MM Ammunition",
+    "Naval Mine Type A",
+    "Emergency Flares"
+)
+_IMPACTED_OPERATIONS = np.array(
+    ["Exercise Taming Sari", "Patrol Operations", "Training Exercises", "Emergency Response"], dtype=object
+)
+
+# Procurement categories as (name, base quantity, base supplier lead time in days)
+_PROCUREMENT_CATEGORIES = (
+    ("EXOCET MM40 Missile", 4, 45),
+    ("A244S Torpedo", 8, 60),
+    ("RDS 76MM Naval Gun Rounds", 500, 30),
+    ("RDS 5.56MM Ammunition", 50000, 20),
+    ("Signal Flares", 200, 15),
+    ("Naval Mine Type A", 12, 75)
+)
+_PROCUREMENT_PRIORITIES = ("urgent", "high", "medium", "low")
+
+# Deadline windows in days: urgent, high, then everything else
+_DEADLINE_WINDOWS = {"urgent": (14, 30), "high": (30, 60)}
+_DEFAULT_DEADLINE_WINDOW = (60, 120)
+
+_PROCUREMENT_RATIONALES = (
+    "Projected shortage based on consumption analysis and scheduled exercises",
+    "Preventive procurement to maintain strategic reserve levels",
+    "Critical for maintaining operational readiness during high-tempo periods",
+    "Required to support upcoming training and exercise schedule",
+    "Essential backup inventory for emergency response capabilities"
+)
+
+# Exercises with the items they draw on, and the recommendations offered for them (sampled as an object array)
+_EXERCISES = (
+    ("Exercise Taming Sari", ("EXOCET MM40", "RDS 76MM")),
+    ("Coastal Patrol Training", ("RDS 5.56MM", "Signal Flares")),
+    ("Multi-National Exercise", ("A244S Torpedo", "Naval Mine")),
+    ("Combat Readiness Assessment", ("All Categories",))
+)
+_OPERATION_RECOMMENDATIONS = np.array([
+    "Pre-position additional inventory at forward bases",
+    "Coordinate with supply chain for expedited delivery",
+    "Consider exercise scope reduction if shortages occur",
+    "Implement strict inventory management protocols",
+    "Activate emergency procurement procedures"
+], dtype=object)
+
+
+class StrategyTemplate(NamedTuple):
+    """Mitigation strategy with its effectiveness and implementation time ranges"""
+    name: str
+    effectiveness_low: float
+    effectiveness_high: float
+    time_low: int
+    time_high: int
+    impact: str
+    items: Tuple[str, ...]
+
+
+class ScenarioConfig(NamedTuple):
+    """What-if scenario with the range of its readiness impact"""
+    name: str
+    description: str
+    impact_range: Tuple[float, float]
+
+
+_STRATEGY_TEMPLATES = (
+    StrategyTemplate("Inventory Redistribution", 0.6, 0.8, 5, 14,
+                     "Optimize distribution across naval bases", ("All Categories",)),
+    StrategyTemplate("Expedited Procurement", 0.7, 0.9, 21, 45,
+                     "Accelerate critical item deliveries", ("EXOCET MM40", "A244S Torpedo")),
+    StrategyTemplate("Exercise Schedule Adjustment", 0.4, 0.7, 1, 7,
+                     "Reduce consumption through schedule optimization", ("Training Ammunition", "Naval Gun Rounds")),
+    StrategyTemplate("Strategic Reserve Activation", 0.8, 0.95, 2, 5,
+                     "Deploy reserve stocks for critical operations", ("Emergency Supplies",)),
+    StrategyTemplate("Alternative Supplier Engagement", 0.5, 0.75, 30, 60,
+                     "Diversify supply chain for reliability", ("Standard Ammunition", "Maintenance Items"))
+)
+
+_SCENARIO_CONFIGS = (
+    ScenarioConfig("Increased Exercise Tempo",
+                   "Enhanced training schedule with 50% more exercises", (-8, -15)),
+    ScenarioConfig("Supply Chain Disruption",
+                   "Major logistics disruption affecting procurement timelines", (-12, -20)),
+    ScenarioConfig("Budget Constraints",
+                   "Significant budget reduction requiring resource optimization", (-5, -12)),
+    ScenarioConfig("Geopolitical Tension",
+                   "Elevated security posture requiring increased readiness", (-10, -18)),
+    ScenarioConfig("Monsoon Impact",
+                   "Seasonal weather effects limiting operations and deliveries", (-3, -8))
+)
+
+# Scenario impact bounds sorted low-to-high (the ranges above are listed high-to-low)
+_SCENARIO_IMPACT_BOUNDS = np.sort([config.impact_range for config in _SCENARIO_CONFIGS], axis=1)
+
+
+# Mock values are generated within their models' types and ranges, so models are built with
+# model_construct and skip per-field validation.
+
+# Mock projections and strategies repeat across forecasts once their values are rounded, so
+# their models are memoized. Cached instances are shared and must be treated as read-only.
+# The size covers every rounded combination the mock ranges can produce (under 2,000 each).
+MOCK_MODEL_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=MOCK_MODEL_CACHE_SIZE)
+def _make_projection(days: int, readiness: float, lower: float, upper: float,
+                     risk_level: RiskLevel) -> ReadinessProjection:
+    """Build a readiness projection, reusing the instance for repeated inputs"""
+    return ReadinessProjection.model_construct(
+        days=days,
+        readiness=readiness,
+        confidence_interval=[lower, upper],
+        risk_level=risk_level
+    )
+
+
+@lru_cache(maxsize=MOCK_MODEL_CACHE_SIZE)
+def _make_mitigation_strategy(name: str, effectiveness: float, implementation_time: int, impact: str,
+                              items_affected: Tuple[str, ...]) -> MitigationStrategy:
+    """Build a mitigation strategy, reusing the instance for repeated inputs"""
+    return MitigationStrategy.model_construct(
+        strategy=name,
+        effectiveness=effectiveness,
+        implementation_time=implementation_time,
+        impact=impact,
+        items_affected=list(items_affected)
+    )
+
+
+def _project_readiness(current_readiness: float, decline_rate: float, days: np.ndarray, seasonal_factor: np.ndarray,
+                       noise: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Project readiness, confidence bounds and risk band indices for each horizon"""
+    # Calculate projected readiness with some randomness
+    decline = decline_rate * (days / 30.0)
+    
+    projected_readiness = np.clip(current_readiness - decline + seasonal_factor + noise, 40.0, 100.0)  # Clamp realistic range
+    
+    # Generate confidence interval (wider for longer horizons)
+    margin = 3 + (days / 30) * 2  # Wider uncertainty for longer periods
+    lower_bounds = np.clip(projected_readiness - margin, 0, 100)
+    upper_bounds = np.clip(projected_readiness + margin, 0, 100)
+    
+    # Determine risk levels
+    risk_indices = np.digitize(projected_readiness, _RISK_THRESHOLDS)
+    
+    return projected_readiness, lower_bounds, upper_bounds, risk_indices
+
+
+def _mock_forecast_id(now: datetime) -> str:
+    """Format a demo forecast ID for the given day"""
+    return f"fcst_demo_{now.strftime('%Y%m%d')}_{uuid.uuid4().hex[:8]}"
+
 
 class MockForecastingService:
     """Service that generates realistic mock forecasting data"""
     
-    def __init__(self):
-        # Seed for consistent but realistic variation
-        random.seed(42)
+    def __init__(self, seed: Optional[int] = None):
+        # Per-instance generator seeded for consistent but realistic variation; the global
+        # random state is left untouched
+        self._rng = np.random.default_rng(seed if seed is not None else MOCK_DEFAULT_SEED)
+        
+        # Forecasts are cached as JSON so every caller decodes its own copy to mutate
+        self._cached_forecast = lru_cache(maxsize=MOCK_FORECAST_CACHE_SIZE)(self._build_forecast_blob)
     
     def generate_mock_forecast(self, current_readiness: float = None, horizon_days: int = 90) -> ForecastResult:
         """Generate a comprehensive mock forecast with realistic data"""
+        return ForecastResult.model_validate(self.generate_mock_forecast_dict(current_readiness, horizon_days))
+    
+    def generate_mock_forecast_dict(self, current_readiness: float = None, horizon_days: int = 90) -> Dict[str, Any]:
+        """Generate a mock forecast as a JSON-ready dict, without building models"""
         
         if current_readiness is None:
-            current_readiness = random.uniform(75.0, 95.0)
+            current_readiness = float(self._rng.uniform(75.0, 95.0))
+        
+        now = datetime.now()
+        readiness_bucket = round(current_readiness / MOCK_READINESS_BUCKET)
+        forecast = orjson.loads(self._cached_forecast(readiness_bucket, horizon_days, now.date()))
+        
+        # Give each forecast its own identity and the readiness it was requested for
+        forecast['forecast_id'] = _mock_forecast_id(now)
+        forecast['generated_at'] = datetime.utcnow().isoformat()
+        forecast['timeframe']['current_readiness'] = float(current_readiness)
+        return forecast
+    
+    def _build_forecast_blob(self, readiness_bucket: int, horizon_days: int, day: date) -> bytes:
+        """Build and serialize the mock forecast for a readiness bucket; the day only keys the cache"""
+        forecast = self._build_forecast(readiness_bucket * MOCK_READINESS_BUCKET, horizon_days)
+        return orjson.dumps(forecast.model_dump(mode='json'))
+    
+    def _build_forecast(self, current_readiness: float, horizon_days: int) -> ForecastResult:
+        """Build a mock forecast for the given readiness and horizon"""
+        # Read the clock once; every date in the forecast is offset from it
+        now = datetime.now()
         
         # Generate forecast ID
-        forecast_id = f"fcst_demo_{datetime.now().strftime('%Y%m%d')}_{str(uuid.uuid4())[:8]}"
+        forecast_id = _mock_forecast_id(now)
         
         # Generate projections with realistic decline over time
         projections = self._generate_projections(current_readiness, horizon_days)
         
-        timeframe = TimeframeProjections(
-            current_readiness=current_readiness,
+        timeframe = TimeframeProjections.model_construct(
+            current_readiness=float(current_readiness),
             projections=projections
         )
         
         # Generate critical alerts based on projections
-        critical_alerts = self._generate_critical_alerts(projections)
+        critical_alerts = self._generate_critical_alerts(projections, now.date())
         
         # Generate procurement recommendations
-        procurement_recommendations = self._generate_procurement_recommendations()
+        procurement_recommendations = self._generate_procurement_recommendations(now.date())
         
         # Generate operation impact assessments
         operation_impact = self._generate_operation_impact()
@@ -53,13 +265,14 @@ class MockForecastingService:
         mitigation_strategies = self._generate_mitigation_strategies()
         
         # Generate confidence metrics
-        confidence_metrics = ConfidenceMetrics(
-            model_accuracy=random.uniform(0.82, 0.94),
-            data_quality_score=random.uniform(0.85, 0.96),
-            forecast_reliability="high" if random.random() > 0.3 else "medium"
+        model_accuracy, data_quality_score = self._rng.uniform((0.82, 0.85), (0.94, 0.96)).tolist()
+        confidence_metrics = ConfidenceMetrics.model_construct(
+            model_accuracy=model_accuracy,
+            data_quality_score=data_quality_score,
+            forecast_reliability="high" if self._rng.random() > 0.3 else "medium"
         )
         
-        return ForecastResult(
+        return ForecastResult.model_construct(
             forecast_id=forecast_id,
             generated_at=datetime.utcnow(),
             timeframe=timeframe,
@@ -71,7 +284,7 @@ class MockForecastingService:
             metadata={
                 'generated_as': 'mock_demo_data',
                 'ai_model': 'demo_fallback',
-                'processing_time_ms': random.randint(800, 1500),
+                'processing_time_ms': int(self._rng.integers(800, 1501)),
                 'data_quality': 'high',
                 'note': 'This is demonstration data for system preview'
             }
@@ -79,160 +292,99 @@ class MockForecastingService:
     
     def _generate_projections(self, current_readiness: float, horizon_days: int) -> List[ReadinessProjection]:
         """Generate realistic readiness projections"""
-        projections = []
+        # Projection horizons within the forecast horizon
+        in_horizon = _PROJECTION_DAYS <= horizon_days
+        days = _PROJECTION_DAYS[in_horizon]
         
         # Base decline rate (readiness typically decreases over time without intervention)
-        base_decline_rate = random.uniform(0.3, 0.8)  # % per month
+        base_decline_rate = self._rng.uniform(0.3, 0.8)  # % per month
         
-        for days in [30, 60, 90]:
-            if days > horizon_days:
-                continue
-                
-            # Calculate projected readiness with some randomness
-            months = days / 30.0
-            decline = base_decline_rate * months
-            
-            # Add some seasonal variation and noise
-            seasonal_factor = math.sin((days / 365.0) * 2 * math.pi) * 2
-            noise = random.uniform(-2, 2)
-            
-            projected_readiness = current_readiness - decline + seasonal_factor + noise
-            projected_readiness = max(40.0, min(100.0, projected_readiness))  # Clamp realistic range
-            
-            # Generate confidence interval (wider for longer horizons)
-            margin = 3 + (days / 30) * 2  # Wider uncertainty for longer periods
-            confidence_interval = [
-                max(0, projected_readiness - margin),
-                min(100, projected_readiness + margin)
-            ]
-            
-            # Determine risk level
-            if projected_readiness < 50:
-                risk_level = RiskLevel.CRITICAL
-            elif projected_readiness < 65:
-                risk_level = RiskLevel.HIGH
-            elif projected_readiness < 80:
-                risk_level = RiskLevel.MEDIUM
-            else:
-                risk_level = RiskLevel.LOW
-            
-            projection = ReadinessProjection(
-                days=days,
-                readiness=round(projected_readiness, 1),
-                confidence_interval=[round(confidence_interval[0], 1), round(confidence_interval[1], 1)],
-                risk_level=risk_level
+        # Per-horizon noise around the trend
+        noise = self._rng.uniform(-2, 2, size=len(days))
+        
+        projected_readiness, lower_bounds, upper_bounds, risk_indices = _project_readiness(
+            current_readiness, base_decline_rate, days, _SEASONAL_FACTORS[in_horizon], noise
+        )
+        
+        projections = [
+            _make_projection(horizon, readiness, lower, upper, _RISK_LEVELS[risk_index])
+            for horizon, readiness, lower, upper, risk_index in zip(
+                days.tolist(),
+                np.round(projected_readiness, 1).tolist(),
+                np.round(lower_bounds, 1).tolist(),
+                np.round(upper_bounds, 1).tolist(),
+                risk_indices.tolist()
             )
-            projections.append(projection)
+        ]
         
         return projections
     
-    def _generate_critical_alerts(self, projections: List[ReadinessProjection]) -> List[CriticalAlert]:
+    def _generate_critical_alerts(self, projections: List[ReadinessProjection], today: date) -> List[CriticalAlert]:
         """Generate realistic critical alerts based on projections"""
         alerts = []
         
-        # Categories that might have shortages
-        ordnance_categories = [
-            "EXOCET MM40 Missile",
-            "A244S Torpedo", 
-            "RDS 76MM Naval Gun",
-            "RDS 5.56MM Ammunition",
-            "Naval Mine Type A",
-            "Emergency Flares"
-        ]
-        
         # Generate 1-3 alerts based on readiness levels
         low_readiness_projections = [p for p in projections if p.readiness < 70]
         
         if low_readiness_projections:
-            num_alerts = min(3, len(low_readiness_projections) + random.randint(0, 2))
+            num_alerts = min(3, len(low_readiness_projections) + int(self._rng.integers(0, 3)))
+            
+            # Determine severity based on readiness level
+            worst_readiness = min(p.readiness for p in projections)
+            severity = _ALERT_SEVERITIES[sum(worst_readiness >= threshold for threshold in _ALERT_SEVERITY_THRESHOLDS)]
+            
+            # Draw every alert's category, shortage date, stock and need in one batch
+            category_indices = self._rng.integers(0, len(_ORDNANCE_CATEGORIES), size=num_alerts).tolist()
+            date_offsets = self._rng.integers(15, 76, size=num_alerts).tolist()
+            stocks = self._rng.integers(20, 151, size=num_alerts)
+            needs = stocks + self._rng.integers(50, 201, size=num_alerts)
+            impacted_counts = self._rng.integers(1, 3, size=num_alerts).tolist()
             
             for i in range(num_alerts):
-                category = random.choice(ordnance_categories)
-                
-                # Determine severity based on readiness level
-                worst_projection = min(projections, key=lambda x: x.readiness)
-                if worst_projection.readiness < 50:
-                    severity = AlertSeverity.CRITICAL
-                elif worst_projection.readiness < 60:
-                    severity = AlertSeverity.HIGH
-                else:
-                    severity = AlertSeverity.MEDIUM
-                
-                # Generate realistic shortage date
-                shortage_date = datetime.now() + timedelta(days=random.randint(15, 75))
-                
-                # Mock current stock and projected need
-                current_stock = random.randint(20, 150)
-                projected_need = current_stock + random.randint(50, 200)
-                
                 # Mock impacted operations
-                operations = ["Exercise Taming Sari", "Patrol Operations", "Training Exercises", "Emergency Response"]
-                impacted_ops = random.sample(operations, random.randint(1, 2))
+                impacted_ops = self._rng.choice(_IMPACTED_OPERATIONS, size=impacted_counts[i], replace=False).tolist()
                 
-                alert = CriticalAlert(
-                    category=category,
-                    expected_shortage_date=shortage_date.strftime('%Y-%m-%d'),
+                alert = CriticalAlert.model_construct(
+                    category=_ORDNANCE_CATEGORIES[category_indices[i]],
+                    expected_shortage_date=(today + timedelta(days=date_offsets[i])).isoformat(),  # Realistic shortage date
                     severity=severity,
                     impacted_operations=impacted_ops,
-                    current_stock_level=current_stock,
-                    projected_need=projected_need
+                    current_stock_level=int(stocks[i]),
+                    projected_need=int(needs[i])
                 )
                 alerts.append(alert)
         
         return alerts
     
-    def _generate_procurement_recommendations(self) -> List[ProcurementRecommendation]:
+    def _generate_procurement_recommendations(self, today: date) -> List[ProcurementRecommendation]:
         """Generate realistic procurement recommendations"""
         recommendations = []
         
-        categories = [
-            ("EXOCET MM40 Missile", 4, 45),
-            ("A244S Torpedo", 8, 60), 
-            ("RDS 76MM Naval Gun Rounds", 500, 30),
-            ("RDS 5.56MM Ammunition", 50000, 20),
-            ("Signal Flares", 200, 15),
-            ("Naval Mine Type A", 12, 75)
-        ]
-        
-        priorities = ["urgent", "high", "medium", "low"]
-        
-        num_recommendations = random.randint(2, 5)
+        num_recommendations = int(self._rng.integers(2, 6))
         
-        for i in range(num_recommendations):
-            category, base_qty, base_lead_time = random.choice(categories)
-            
-            priority = priorities[min(i, len(priorities)-1)]
-            
-            # Vary quantities and lead times
-            quantity = base_qty + random.randint(-base_qty//3, base_qty//2)
-            lead_time = base_lead_time + random.randint(-5, 10)
-            
-            # Generate deadline based on priority
-            if priority == "urgent":
-                deadline_days = random.randint(14, 30)
-            elif priority == "high":
-                deadline_days = random.randint(30, 60)
-            else:
-                deadline_days = random.randint(60, 120)
-                
-            deadline = (datetime.now() + timedelta(days=deadline_days)).strftime('%Y-%m-%d')
-            
-            # Generate rationale
-            rationales = [
-                f"Projected shortage based on consumption analysis and scheduled exercises",
-                f"Preventive procurement to maintain strategic reserve levels",
-                f"Critical for maintaining operational readiness during high-tempo periods",
-                f"Required to support upcoming training and exercise schedule",
-                f"Essential backup inventory for emergency response capabilities"
-            ]
-            
-            recommendation = ProcurementRecommendation(
-                priority=priority,
+        # Draw every recommendation's category, variation, deadline and rationale in one batch
+        selected = [
+            _PROCUREMENT_CATEGORIES[i]
+            for i in self._rng.integers(0, len(_PROCUREMENT_CATEGORIES), size=num_recommendations).tolist()
+        ]
+        base_qtys = np.array([base_qty for _, base_qty, _ in selected])
+        selected_priorities = [_PROCUREMENT_PRIORITIES[min(i, len(_PROCUREMENT_PRIORITIES)-1)] for i in range(num_recommendations)]
+        deadline_bounds = np.array([_DEADLINE_WINDOWS.get(priority, _DEFAULT_DEADLINE_WINDOW) for priority in selected_priorities])
+        
+        # Vary quantities and lead times
+        quantities = (base_qtys + self._rng.integers((-base_qtys) // 3, base_qtys // 2 + 1)).tolist()
+        lead_time_offsets = self._rng.integers(-5, 11, size=num_recommendations).tolist()
+        deadline_days = self._rng.integers(deadline_bounds[:, 0], deadline_bounds[:, 1] + 1).tolist()
+        rationale_indices = self._rng.integers(0, len(_PROCUREMENT_RATIONALES), size=num_recommendations).tolist()
+        
+        for i, (category, _, base_lead_time) in enumerate(selected):
+            recommendation = ProcurementRecommendation.model_construct(
+                priority=selected_priorities[i],
                 category=category,
-                recommended_quantity=quantity,
-                deadline=deadline,
-                rationale=random.choice(rationales),
-                supplier_lead_time=lead_time
+                recommended_quantity=quantities[i],
+                deadline=(today + timedelta(days=deadline_days[i])).isoformat(),
+                rationale=_PROCUREMENT_RATIONALES[rationale_indices[i]],
+                supplier_lead_time=base_lead_time + lead_time_offsets[i]
             )
             recommendations.append(recommendation)
         
@@ -242,35 +394,26 @@ class MockForecastingService:
         """Generate realistic operation impact assessments"""
         operations = []
         
-        exercises = [
-            ("Exercise Taming Sari", ["EXOCET MM40", "RDS 76MM"]),
-            ("Coastal Patrol Training", ["RDS 5.56MM", "Signal Flares"]),
-            ("Multi-National Exercise", ["A244S Torpedo", "Naval Mine"]),
-            ("Combat Readiness Assessment", ["All Categories"])
-        ]
+        num_operations = int(self._rng.integers(1, 4))
+        
+        # Draw every operation's exercise, impact and recommendation count in one batch
+        exercise_indices = self._rng.integers(0, len(_EXERCISES), size=num_operations).tolist()
         
-        num_operations = random.randint(1, 3)
+        # Generate impact (negative for most cases)
+        readiness_impacts = np.round(self._rng.uniform(-15.0, -3.0, size=num_operations), 1).tolist()
+        recommendation_counts = self._rng.integers(2, 5, size=num_operations).tolist()
         
         for i in range(num_operations):
-            exercise_name, affected_items = random.choice(exercises)
-            
-            # Generate impact (negative for most cases)
-            readiness_impact = random.uniform(-15.0, -3.0)
-            
-            recommendations = [
-                "Pre-position additional inventory at forward bases",
-                "Coordinate with supply chain for expedited delivery",
-                "Consider exercise scope reduction if shortages occur",
-                "Implement strict inventory management protocols",
-                "Activate emergency procurement procedures"
-            ]
+            exercise_name, affected_items = _EXERCISES[exercise_indices[i]]
             
-            selected_recommendations = random.sample(recommendations, random.randint(2, 4))
+            selected_recommendations = self._rng.choice(
+                _OPERATION_RECOMMENDATIONS, size=recommendation_counts[i], replace=False
+            ).tolist()
             
-            impact = OperationImpactAssessment(
+            impact = OperationImpactAssessment.model_construct(
                 exercise_name=exercise_name,
-                readiness_impact=round(readiness_impact, 1),
-                critical_items_affected=affected_items,
+                readiness_impact=readiness_impacts[i],
+                critical_items_affected=list(affected_items),
                 recommendations=selected_recommendations
             )
             operations.append(impact)
@@ -279,132 +422,90 @@ class MockForecastingService:
     
     def _generate_mitigation_strategies(self) -> List[MitigationStrategy]:
         """Generate realistic mitigation strategies"""
-        strategies = []
-        
-        strategy_templates = [
-            {
-                "name": "Inventory Redistribution",
-                "effectiveness": (0.6, 0.8),
-                "time": (5, 14),
-                "impact": "Optimize distribution across naval bases",
-                "items": ["All Categories"]
-            },
-            {
-                "name": "Expedited Procurement",
-                "effectiveness": (0.7, 0.9),
-                "time": (21, 45),
-                "impact": "Accelerate critical item deliveries",
-                "items": ["EXOCET MM40", "A244S Torpedo"]
-            },
-            {
-                "name": "Exercise Schedule Adjustment",
-                "effectiveness": (0.4, 0.7),
-                "time": (1, 7),
-                "impact": "Reduce consumption through schedule optimization",
-                "items": ["Training Ammunition", "Naval Gun Rounds"]
-            },
-            {
-                "name": "Strategic Reserve Activation",
-                "effectiveness": (0.8, 0.95),
-                "time": (2, 5),
-                "impact": "Deploy reserve stocks for critical operations",
-                "items": ["Emergency Supplies"]
-            },
-            {
-                "name": "Alternative Supplier Engagement",
-                "effectiveness": (0.5, 0.75),
-                "time": (30, 60),
-                "impact": "Diversify supply chain for reliability",
-                "items": ["Standard Ammunition", "Maintenance Items"]
-            }
+        num_strategies = int(self._rng.integers(3, 6))
+        selected_templates = [
+            _STRATEGY_TEMPLATES[i]
+            for i in self._rng.choice(len(_STRATEGY_TEMPLATES), size=num_strategies, replace=False).tolist()
         ]
         
-        num_strategies = random.randint(3, 5)
-        selected_templates = random.sample(strategy_templates, num_strategies)
-        
-        for template in selected_templates:
-            effectiveness = random.uniform(*template["effectiveness"])
-            time = random.randint(*template["time"])
-            
-            strategy = MitigationStrategy(
-                strategy=template["name"],
-                effectiveness=round(effectiveness, 2),
-                implementation_time=time,
-                impact=template["impact"],
-                items_affected=template["items"]
-            )
-            strategies.append(strategy)
+        # Draw every strategy's effectiveness and implementation time in one batch
+        effectiveness_values = np.round(self._rng.uniform(
+            [template.effectiveness_low for template in selected_templates],
+            [template.effectiveness_high for template in selected_templates]
+        ), 2).tolist()
+        times = self._rng.integers(
+            [template.time_low for template in selected_templates],
+            [template.time_high + 1 for template in selected_templates]
+        ).tolist()
+        
+        strategies = [
+            _make_mitigation_strategy(template.name, effectiveness, time, template.impact, template.items)
+            for template, effectiveness, time in zip(selected_templates, effectiveness_values, times)
+        ]
         
         return strategies
     
     def generate_mock_scenarios(self, base_forecast: ForecastResult) -> List[ScenarioResult]:
         """Generate mock scenario results"""
         scenarios = []
-        
-        scenario_configs = [
-            {
-                "name": "Increased Exercise Tempo", 
-                "description": "Enhanced training schedule with 50% more exercises",
-                "impact_range": (-8, -15)
-            },
-            {
-                "name": "Supply Chain Disruption",
-                "description": "Major logistics disruption affecting procurement timelines",
-                "impact_range": (-12, -20)
-            },
-            {
-                "name": "Budget Constraints",
-                "description": "Significant budget reduction requiring resource optimization", 
-                "impact_range": (-5, -12)
-            },
-            {
-                "name": "Geopolitical Tension",
-                "description": "Elevated security posture requiring increased readiness",
-                "impact_range": (-10, -18)
-            },
-            {
-                "name": "Monsoon Impact", 
-                "description": "Seasonal weather effects limiting operations and deliveries",
-                "impact_range": (-3, -8)
-            }
-        ]
+        generated_at = datetime.utcnow().isoformat()
         
         base_readiness = base_forecast.timeframe.current_readiness
-        
-        for config in scenario_configs:
-            impact = random.uniform(*config["impact_range"])
-            scenario_readiness = max(20.0, base_readiness + impact)
+        projections = base_forecast.timeframe.projections
+        
+        # Draw every scenario's impact, timeline noise, risk counts and confidence in one batch
+        impacts = self._rng.uniform(_SCENARIO_IMPACT_BOUNDS[:, 0], _SCENARIO_IMPACT_BOUNDS[:, 1])
+        timeline_noise = self._rng.uniform(-2, 2, size=(len(_SCENARIO_CONFIGS), len(projections)))
+        critical_alert_counts = self._rng.integers(1, 5, size=len(_SCENARIO_CONFIGS)).tolist()
+        recommendation_counts = self._rng.integers(2, 7, size=len(_SCENARIO_CONFIGS)).tolist()
+        confidences = self._rng.uniform(0.75, 0.90, size=len(_SCENARIO_CONFIGS)).tolist()
+        
+        # Adjusted readiness for every scenario (rows) and projection horizon (columns)
+        projection_days = [proj.days for proj in projections]
+        projection_readiness = np.array([proj.readiness for proj in projections])
+        adjusted_readiness = np.maximum(projection_readiness[None, :] + impacts[:, None] + timeline_noise, 15.0)
+        adjusted_rows = adjusted_readiness.tolist()
+        lower_rows = (adjusted_readiness - 5).tolist()
+        upper_rows = (adjusted_readiness + 5).tolist()
+        risk_rows = (adjusted_readiness >= _SCENARIO_RISK_THRESHOLD).tolist()
+        
+        # Scenario-level readiness and impact, rounded for reporting
+        scenario_readiness_values = np.round(np.maximum(base_readiness + impacts, 20.0), 1).tolist()
+        rounded_impacts = np.round(impacts, 1).tolist()
+        elevated_risk = (impacts < -10).tolist()
+        
+        for i, config in enumerate(_SCENARIO_CONFIGS):
             
             # Generate mock timeline comparison
-            timeline_comparison = []
-            for proj in base_forecast.timeframe.projections:
-                adjusted_readiness = max(15.0, proj.readiness + impact + random.uniform(-2, 2))
-                
-                scenario_proj = ReadinessProjection(
-                    days=proj.days,
-                    readiness=adjusted_readiness,
-                    confidence_interval=[adjusted_readiness - 5, adjusted_readiness + 5],
-                    risk_level=RiskLevel.HIGH if adjusted_readiness < 60 else RiskLevel.MEDIUM
+            timeline_comparison = [
+                ReadinessProjection.model_construct(
+                    days=days,
+                    readiness=readiness,
+                    confidence_interval=[lower, upper],
+                    risk_level=_SCENARIO_RISK_LEVELS[at_or_above_threshold]
+                )
+                for days, readiness, lower, upper, at_or_above_threshold in zip(
+                    projection_days, adjusted_rows[i], lower_rows[i], upper_rows[i], risk_rows[i]
                 )
-                timeline_comparison.append(scenario_proj)
+            ]
             
-            scenario = ScenarioResult(
-                scenario_name=config["name"],
-                description=config["description"],
+            scenario = ScenarioResult.model_construct(
+                scenario_name=config.name,
+                description=config.description,
                 base_readiness=base_readiness,
-                scenario_readiness=round(scenario_readiness, 1),
-                readiness_impact=round(impact, 1),
+                scenario_readiness=scenario_readiness_values[i],
+                readiness_impact=rounded_impacts[i],
                 risk_assessment={
-                    "critical_alerts": random.randint(1, 4),
-                    "high_priority_recommendations": random.randint(2, 6),
-                    "overall_risk": "elevated" if impact < -10 else "moderate"
+                    "critical_alerts": critical_alert_counts[i],
+                    "high_priority_recommendations": recommendation_counts[i],
+                    "overall_risk": "elevated" if elevated_risk[i] else "moderate"
                 },
                 recommendations=base_forecast.mitigation_strategies[:3],  # Reuse some strategies
                 timeline_comparison=timeline_comparison,
                 metadata={
                     "scenario_type": "mock_demonstration",
-                    "generated_at": datetime.utcnow().isoformat(),
-                    "confidence": random.uniform(0.75, 0.90)
+                    "generated_at": generated_at,
+                    "confidence": confidences[i]
                 }
             )
             scenarios.append(scenario)